@@ -1,4 +1,4 @@
-import asyncio, platform
+import asyncio, sys
 from prefect import flow, task
 from prefect.task_runners import DaskTaskRunner, SequentialTaskRunner
 
@@ -21,6 +21,6 @@ def dask_subflow():
     hello_dask()
 
 if __name__ == "__main__":
-    if platform.system()=='Windows':
+    if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     sequential_flow()
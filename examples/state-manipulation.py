@@ -1,4 +1,4 @@
-import asyncio, random, platform, time
+import asyncio, random, sys, time
 from prefect import task, flow
 from prefect.task_runners import DaskTaskRunner
 
@@ -17,8 +17,8 @@ def fail():
 def complex_flow_logic():
     long_sleep = sleep(10)
 
-    time.sleep(2)
-    if long_sleep.get_state().is_running():
+    # returns None if the task has not finished within the timeout
+    if long_sleep.wait(timeout=2) is None:
         print('Long sleep task is still running!')
 
     # blocks until complete and returns state
@@ -32,6 +32,6 @@ def complex_flow_logic():
         print('result was good')
 
 if __name__ == "__main__":
-    if platform.system()=='Windows':
+    if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
     complex_flow_logic()
\ No newline at end of file
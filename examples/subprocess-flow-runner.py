@@ -3,11 +3,13 @@ from datetime import datetime
 from prefect.deployments import DeploymentSpec
 from prefect.flow_runners import SubprocessFlowRunner
 
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
 @flow
 def what_day_is_it(date: datetime = None):
     if date is None:
         date = datetime.utcnow()
-    print(f"It was {date.strftime('%A')} on {date.isoformat()}")
+    print(f"It was {WEEKDAYS[date.weekday()]} on {date.isoformat()}")
 
 DeploymentSpec(
     flow=what_day_is_it,